@@ -0,0 +1,135 @@
+# actions.py
+import random
+import time
+from cell import HIDDEN_CODE, FLAG_CODE
+
+# Action kinds the event loop can enqueue
+REVEAL = "reveal"
+FLAG = "flag"
+CHORD = "chord"
+
+class ActionQueue:
+    """
+    Collects player intents between frames and applies them to the game in one batch.
+    Each action sees the board left by the ones before it, so a batch ends the
+    same as applying the clicks one at a time. Reveals and flags on already
+    revealed cells are dropped (a reveal on a revealed number chords it, like a
+    click would), as are chords anywhere but a revealed number. A flood fill
+    stops at cells an earlier one opened, and a flag toggled twice in the same
+    batch cancels out.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.pending = []
+        self.applied = 0  # actions that reached the game, for throughput measurement
+
+    def __len__(self):
+        return len(self.pending)
+
+    def enqueue(self, action, x, y):
+        """Queue an action for the cell at the given coordinates."""
+        self.pending.append((action, x, y))
+
+    def clear(self):
+        """Drop all pending actions."""
+        self.pending = []
+
+    def coalesce(self):
+        """Return the pending actions with flag toggles that cancel each other removed."""
+        result = []
+        last_flag = {}  # cell -> index in result of its latest uncancelled flag
+
+        for action, x, y in self.pending:
+            if action == FLAG:
+                if (x, y) in last_flag:
+                    result[last_flag.pop((x, y))] = None
+                    continue
+                last_flag[(x, y)] = len(result)
+            else:
+                # A reveal or chord may flood into a flagged cell, so flags
+                # queued before it can no longer be cancelled by later ones
+                last_flag.clear()
+            result.append((action, x, y))
+
+        return [entry for entry in result if entry is not None]
+
+    def apply_pending(self):
+        """
+        Apply pending actions in order. If the game ends part way through, the
+        remaining actions stay queued for the next game (main.py clears them
+        on restart). Returns True if the board changed and needs to be redrawn.
+        """
+        actions = self.coalesce()
+        self.pending = []
+
+        changed = False
+
+        for i, (action, x, y) in enumerate(actions):
+            if self.game.is_game_over() or self.game.is_win():
+                self.pending = actions[i:]
+                break
+            if not (0 <= x < self.game.width and 0 <= y < self.game.height):
+                continue
+
+            code = self.game.get_cell_code(x, y)
+            if action == REVEAL and code == HIDDEN_CODE:
+                changed |= self.game.reveal_cell(x, y)
+            elif action == FLAG:
+                # Only hidden cells can be flagged or unflagged
+                if code not in (HIDDEN_CODE, FLAG_CODE):
+                    continue
+                changed |= self.game.toggle_flag(x, y)
+            else:
+                # Chords, and clicks on revealed cells, only act on revealed numbers
+                if not 0 < code < HIDDEN_CODE:
+                    continue
+                changed |= self.game.chord(x, y)
+            self.applied += 1
+
+        return changed
+
+def synthetic_actions(width, height, count, seed=None):
+    """Yield random (action, x, y) tuples that mimic fast clicking across the board."""
+    rng = random.Random(seed)
+    kinds = [REVEAL, FLAG, CHORD]
+    weights = [0.7, 0.2, 0.1]
+
+    for _ in range(count):
+        action = rng.choices(kinds, weights)[0]
+        yield action, rng.randrange(width), rng.randrange(height)
+
+def measure_actions_per_second(game, actions, batch_size=32):
+    """
+    Feed actions through an ActionQueue in batches of batch_size and return the
+    sustained number of actions that reached the game per second. Actions
+    dropped as no-ops (reveals or flags on revealed cells, chords off a revealed
+    number) and cancelled flag pairs are not counted. A new game is
+    started as soon as one ends, and the actions left in its batch are applied
+    to the new game.
+    """
+    queue = ActionQueue(game)
+
+    def drain():
+        while True:
+            queue.apply_pending()
+            if game.is_game_over() or game.is_win():
+                game.new_game()
+            if not len(queue):
+                break
+
+    start = time.perf_counter()
+    for action in actions:
+        queue.enqueue(*action)
+        if len(queue) >= batch_size:
+            drain()
+    drain()
+    elapsed = time.perf_counter() - start
+
+    return queue.applied / elapsed if elapsed > 0 else float("inf")
+
+if __name__ == "__main__":
+    from game import MinesweeperGame
+
+    game = MinesweeperGame(30, 16, 99)
+    rate = measure_actions_per_second(game, synthetic_actions(30, 16, 100000, seed=0))
+    print(f"{rate:,.0f} actions/s")
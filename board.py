@@ -1,6 +1,6 @@
 import random
 import numpy as np
-from cell import Cell
+from cell import Cell, HIDDEN_CODE
 
 class Board:
     def __init__(self, width, height, num_mines):
@@ -11,8 +11,16 @@ class Board:
         self.game_over = False
         self.win = False
         
+        # Non-mine cells still hidden, so the win check doesn't scan the grid
+        self.hidden_safe_cells = width * height - self.num_mines
+        
         # Initialize board with cells
         self.grid = np.array([[Cell() for _ in range(width)] for _ in range(height)])
+        
+        # Visible state of every cell as a uint8 code, kept in step with the
+        # grid by the methods below so renderers don't rebuild it each frame
+        self.state_codes = np.full((height, width), HIDDEN_CODE, dtype=np.uint8)
+        self.mine_positions = []
     
     def place_mines(self, first_x, first_y):
         """Place mines randomly, ensuring first clicked cell is not a mine."""
@@ -33,6 +41,8 @@ class Board:
         # Randomly select mine positions
         mine_positions = random.sample(mine_candidates, self.num_mines)
         
+        self.mine_positions = mine_positions
+        
         # Place mines and update adjacent counts
         for x, y in mine_positions:
             self.grid[y][x].place_mine()
@@ -46,47 +56,72 @@ class Board:
     
     def reveal_cell(self, x, y):
         """Reveal a cell. If it's the first move, place mines first."""
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            return False
+        return self.reveal_cells([(x, y)]) > 0
+    
+    def reveal_cells(self, positions):
+        """
+        Reveal several cells in the order given, stopping as soon as the game ends.
+        Overlapping flood fills share the same walk, so a cell opened by an
+        earlier position is skipped for later ones. Returns the number of cells
+        newly revealed.
+        """
+        positions = [(x, y) for x, y in positions if 0 <= x < self.width and 0 <= y < self.height]
+        if not positions:
+            return 0
         
         # Handle first move
         if not self.first_move_made:
-            self.place_mines(x, y)
+            self.place_mines(*positions[0])
             self.first_move_made = True
         
-        cell = self.grid[y][x]
-        
-        # If already revealed or flagged, do nothing
-        if cell.is_revealed or cell.is_flagged:
-            return False
-        
-        # Reveal the cell
-        cell.reveal()
-        
-        # Check if mine was hit
-        if cell.is_mine:
-            self.game_over = True
-            return True
-        
-        # If empty cell (no adjacent mines), reveal adjacent cells recursively
-        if cell.adjacent_mines == 0:
-            for dx in range(-1, 2):
-                for dy in range(-1, 2):
-                    nx, ny = x + dx, y + dy
-                    if 0 <= nx < self.width and 0 <= ny < self.height and not (dx == 0 and dy == 0):
-                        self.reveal_cell(nx, ny)
-        
-        # Check for win condition
-        self.check_win()
+        revealed = 0
+        for start in positions:
+            stack = [start]
+            while stack:
+                x, y = stack.pop()
+                cell = self.grid[y][x]
+                
+                # If already revealed or flagged, do nothing
+                if cell.is_revealed or cell.is_flagged:
+                    continue
+                
+                # Reveal the cell
+                cell.reveal()
+                self.state_codes[y, x] = cell.state_code()
+                revealed += 1
+                
+                # Check if mine was hit
+                if cell.is_mine:
+                    self.game_over = True
+                    return revealed
+                self.hidden_safe_cells -= 1
+                
+                # If empty cell (no adjacent mines), reveal adjacent cells too
+                if cell.adjacent_mines == 0:
+                    for dx in range(-1, 2):
+                        for dy in range(-1, 2):
+                            nx, ny = x + dx, y + dy
+                            if 0 <= nx < self.width and 0 <= ny < self.height and not (dx == 0 and dy == 0):
+                                if not self.grid[ny][nx].is_revealed:
+                                    stack.append((nx, ny))
+            
+            # Check for win condition
+            if self.check_win():
+                break
         
-        return True
+        return revealed
     
     def toggle_flag(self, x, y):
         """Toggle flag on a cell."""
         if not (0 <= x < self.width and 0 <= y < self.height):
             return False
         
-        return self.grid[y][x].toggle_flag()
+        cell = self.grid[y][x]
+        if not cell.toggle_flag():
+            return False
+        
+        self.state_codes[y, x] = cell.state_code()
+        return True
     
     def chord(self, x, y):
         """
@@ -130,12 +165,13 @@ class Board:
                             # Incorrect flag found! Reveal and trigger game over
                             adjacent_cell.is_flagged = False
                             adjacent_cell.reveal()
+                            self.state_codes[ny, nx] = adjacent_cell.state_code()
+                            self.hidden_safe_cells -= 1
                             self.game_over = True
                             return True
             
             # All flags are correct, reveal all unflagged adjacent cells
-            for nx, ny in adjacent_cells:
-                self.reveal_cell(nx, ny)
+            self.reveal_cells(adjacent_cells)
             
             return True
         
@@ -143,12 +179,8 @@ class Board:
     
     def check_win(self):
         """Check if all non-mine cells are revealed."""
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.grid[y][x]
-                # If a non-mine cell is not revealed, game is not won yet
-                if not cell.is_mine and not cell.is_revealed:
-                    return False
+        if self.hidden_safe_cells > 0:
+            return False
         
         # All non-mine cells are revealed, game is won
         self.win = True
@@ -158,6 +190,17 @@ class Board:
         """Return a 2D array representation of the visible board."""
         return [[str(self.grid[y][x]) for x in range(self.width)] for y in range(self.height)]
     
+    def reveal_mines(self):
+        """Reveal every mine, for showing the board after the game is lost."""
+        for x, y in self.mine_positions:
+            cell = self.grid[y][x]
+            cell.is_revealed = True
+            self.state_codes[y, x] = cell.state_code()
+    
+    def get_state_codes(self):
+        """Return a copy of the visible board as a (height, width) uint8 array of cell state codes."""
+        return self.state_codes.copy()
+    
     def __str__(self):
         """String representation of the board for console display."""
         result = ""
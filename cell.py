@@ -1,3 +1,9 @@
+# Compact codes for each visible cell state: 0-8 adjacent mines, then hidden, flag, mine
+HIDDEN_CODE = 9
+FLAG_CODE = 10
+MINE_CODE = 11
+STATE_CODES = {" ": 0, **{str(n): n for n in range(1, 9)}, "■": HIDDEN_CODE, "F": FLAG_CODE, "X": MINE_CODE}
+
 class Cell:
     def __init__(self):
         self.is_mine = False
@@ -27,6 +33,16 @@ class Cell:
         """Increment the adjacent mine counter."""
         self.adjacent_mines += 1
     
+    def state_code(self):
+        """Return the visible state of this cell as one of STATE_CODES."""
+        if self.is_flagged:
+            return FLAG_CODE
+        if not self.is_revealed:
+            return HIDDEN_CODE
+        if self.is_mine:
+            return MINE_CODE
+        return self.adjacent_mines
+    
     def __str__(self):
         if self.is_flagged:
             return "F"
@@ -60,6 +60,18 @@ class MinesweeperGame:
         """Get the current visible state of the board."""
         return self.board.get_visible_board()
     
+    def get_board_codes(self):
+        """Get the current visible state of the board as a uint8 code array."""
+        return self.board.get_state_codes()
+    
+    def get_cell_code(self, x, y):
+        """Get the visible state code of the cell at the given coordinates."""
+        return int(self.board.state_codes[y, x])
+    
+    def reveal_mines(self):
+        """Reveal every mine, for showing the board after the game is lost."""
+        self.board.reveal_mines()
+    
     def is_game_over(self):
         """Check if the game is over."""
         return self.game_over
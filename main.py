@@ -1,9 +1,18 @@
 # main.py
+import os
 import pygame
 import sys
 import time
 from game import MinesweeperGame
+from actions import ActionQueue, REVEAL, FLAG
 from ui.renderer import GameRenderer
+from ui.atlas_renderer import AtlasRenderer
+
+# Available board renderers: "classic" draws cell by cell, "atlas" blits from a tile atlas
+RENDERERS = {
+    "classic": GameRenderer,
+    "atlas": AtlasRenderer,
+}
 
 def main():
     # Game parameters
@@ -11,10 +20,17 @@ def main():
     height = 10
     num_mines = 15
     cell_size = 40
+    renderer_backend = os.environ.get("MINESWEEPER_RENDERER", "classic")
+    if renderer_backend not in RENDERERS:
+        print(f"Warning: unknown renderer '{renderer_backend}', "
+              f"expected one of: {', '.join(RENDERERS)}. Using 'classic'.")
+        renderer_backend = "classic"
     
     # Initialize game and renderer
     game = MinesweeperGame(width, height, num_mines)
-    renderer = GameRenderer(width, height, cell_size)
+    renderer = RENDERERS[renderer_backend](width, height, cell_size)
+    actions = ActionQueue(game)
+    clock = pygame.time.Clock()
     
     # Variables for tracking game time
     start_time = time.time()
@@ -62,9 +78,9 @@ def main():
                     running = False
                 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Get the position of the click
-                    pos = pygame.mouse.get_pos()
-                    cell_pos = renderer.get_cell_at_pos(pos)
+                    # Use the position stored with the event, since queued clicks
+                    # are applied after the pointer may have moved on
+                    cell_pos = renderer.get_cell_at_pos(event.pos)
                     
                     if cell_pos:
                         x, y = cell_pos
@@ -74,54 +90,49 @@ def main():
                             if game.is_game_over() or game.is_win():
                                 # Restart the game
                                 game.new_game()
+                                actions.clear()
                                 start_time = time.time()
                                 game_time = 0
                                 last_time_update = 0
                                 timer_paused = False
+                                need_board_update = True
                             else:
-                                # Get the board state to check if we're clicking on a revealed number
-                                board_state = game.get_board_state()
-                                try:
-                                    cell_value = board_state[y][x]
-                                    # If it's a revealed number, try to chord
-                                    if cell_value not in ["■", "F", "X", " "]:
-                                        game.chord(x, y)
-                                    else:
-                                        # Otherwise, just reveal the cell
-                                        game.reveal_cell(x, y)
-                                except (IndexError, ValueError):
-                                    # If there's any error, just do a normal reveal
-                                    game.reveal_cell(x, y)
-                            
-                            need_board_update = True
+                                # Revealed numbers are chorded when the batch is applied
+                                actions.enqueue(REVEAL, x, y)
                         
                         # Right click - toggle flag
                         elif event.button == 3:
                             if not (game.is_game_over() or game.is_win()):
-                                game.toggle_flag(x, y)
-                                need_board_update = True
-                                
-                                # Update stats display immediately after flagging
-                                renderer.draw_stats(
-                                    game.get_flags_remaining(),
-                                    game.flags_used,
-                                    game_time
-                                )
-                                pygame.display.update(pygame.Rect(0, 0, renderer.screen_width, renderer.stats_height))
+                                actions.enqueue(FLAG, x, y)
+            
+            # Apply all clicks from this frame as one batch
+            flags_before = game.flags_used
+            if actions.apply_pending():
+                need_board_update = True
+                
+                # Update stats display immediately after flagging
+                if game.flags_used != flags_before:
+                    renderer.draw_stats(
+                        game.get_flags_remaining(),
+                        game.flags_used,
+                        game_time
+                    )
+                    pygame.display.update(pygame.Rect(0, 0, renderer.screen_width, renderer.stats_height))
             
             # Only redraw the board when needed (on init and after events)
             if need_board_update:
                 # If game over, ensure we reveal all mines for proper rendering
                 if game.is_game_over():
                     # Make sure all mines are revealed in the board display
-                    for y in range(game.height):
-                        for x in range(game.width):
-                            cell = game.board.grid[y][x]
-                            if cell.is_mine:
-                                cell.is_revealed = True
+                    game.reveal_mines()
+                
+                if renderer.uses_state_codes:
+                    board_state = game.get_board_codes()
+                else:
+                    board_state = game.get_board_state()
                 
                 renderer.draw_board(
-                    game.get_board_state(),
+                    board_state,
                     game.is_game_over(),
                     game.is_win()
                 )
@@ -132,7 +143,7 @@ def main():
                 need_board_update = False
             
             # Cap the frame rate
-            pygame.time.Clock().tick(30)
+            clock.tick(30)
     
     except Exception as e:
         print(f"Error: {e}")
@@ -0,0 +1,161 @@
+import random
+import unittest
+from board import Board
+from cell import STATE_CODES
+from game import MinesweeperGame
+from actions import ActionQueue, REVEAL, FLAG, CHORD, synthetic_actions, measure_actions_per_second
+
+class TestActionQueue(unittest.TestCase):
+    def setUp(self):
+        self.game = MinesweeperGame(10, 10, 15)
+        self.queue = ActionQueue(self.game)
+
+    def test_first_reveal_applies(self):
+        """Test that a queued reveal is applied when the batch runs."""
+        self.queue.enqueue(REVEAL, 5, 5)
+        self.assertTrue(self.queue.apply_pending())
+        self.assertTrue(self.game.board.grid[5][5].is_revealed)
+        self.assertEqual(len(self.queue), 0)
+
+    def test_reveal_on_revealed_cell_is_dropped(self):
+        """Test that revealing an already revealed blank cell changes nothing."""
+        self.game.reveal_cell(5, 5)
+        # The first click is always safe, find a revealed blank cell to click again
+        blanks = [(x, y) for y in range(10) for x in range(10)
+                  if self.game.board.grid[y][x].is_revealed and self.game.board.grid[y][x].adjacent_mines == 0]
+        x, y = blanks[0]
+        self.queue.enqueue(REVEAL, x, y)
+        self.queue.enqueue(REVEAL, x, y)
+        self.assertFalse(self.queue.apply_pending())
+
+    def test_flag_and_chord_no_ops_are_dropped(self):
+        """Test that flags on revealed cells and chords off revealed numbers are not applied."""
+        self.game.reveal_cell(5, 5)
+        self.queue.enqueue(FLAG, 5, 5)
+        self.assertFalse(self.queue.apply_pending())
+        self.assertEqual(self.queue.applied, 0)
+        self.assertEqual(self.game.flags_used, 0)
+
+        hidden = next((x, y) for y in range(10) for x in range(10)
+                      if not self.game.board.grid[y][x].is_revealed)
+        self.queue.enqueue(CHORD, *hidden)
+        self.queue.enqueue(CHORD, 5, 5)  # the first click is always a blank cell
+        self.assertFalse(self.queue.apply_pending())
+        self.assertEqual(self.queue.applied, 0)
+
+    def test_double_flag_cancels(self):
+        """Test that flagging a cell twice in one batch is a no-op."""
+        self.queue.enqueue(FLAG, 0, 0)
+        self.queue.enqueue(FLAG, 0, 0)
+        self.assertEqual(self.queue.coalesce(), [])
+        self.assertFalse(self.queue.apply_pending())
+        self.assertFalse(self.game.board.grid[0][0].is_flagged)
+        self.assertEqual(self.game.flags_used, 0)
+
+    def test_flag_blocks_later_reveal(self):
+        """Test that actions are applied in order within a batch."""
+        self.game.reveal_cell(5, 5)
+        x, y = next((x, y) for y in range(10) for x in range(10)
+                    if not self.game.board.grid[y][x].is_revealed)
+        self.queue.enqueue(FLAG, x, y)
+        self.queue.enqueue(REVEAL, x, y)
+        self.assertTrue(self.queue.apply_pending())
+        self.assertTrue(self.game.board.grid[y][x].is_flagged)
+        self.assertFalse(self.game.board.grid[y][x].is_revealed)
+
+    def test_chord_on_number_opened_in_same_batch(self):
+        """Test that clicking a number uncovered earlier in the batch chords it."""
+        # One mine in the top right corner
+        board = Board(5, 5, 1)
+        board.first_move_made = True
+        board.grid[0][4].place_mine()
+        for x, y in [(3, 0), (3, 1), (4, 1)]:
+            board.grid[y][x].increment_adjacent()
+        self.game.board = board
+        self.game.width = self.game.height = 5
+
+        # Wrong flag next to the number at (3, 0), then flood to it and click it
+        self.queue.enqueue(FLAG, 4, 1)
+        self.queue.enqueue(REVEAL, 0, 4)
+        self.queue.enqueue(REVEAL, 3, 0)
+        self.queue.apply_pending()
+
+        self.assertTrue(board.grid[1][4].is_revealed)
+        self.assertTrue(self.game.is_game_over())
+
+    def test_batch_matches_sequential(self):
+        """Test that batches leave the game as one-at-a-time actions would."""
+        self.addCleanup(random.setstate, random.getstate())
+        for seed in range(20):
+            rng = random.Random(seed)
+            actions = list(synthetic_actions(10, 10, 300, seed=seed))
+            batches = []
+            while actions:
+                size = rng.randint(1, 8)
+                batches.append(actions[:size])
+                actions = actions[size:]
+
+            # Seed the mine placement the same way for both games, and record
+            # the state at the end of every game and every batch
+            random.seed(seed)
+            sequential = MinesweeperGame(10, 10, 8)
+            expected = []
+            for batch in batches:
+                for action, x, y in batch:
+                    cell = sequential.board.grid[y][x]
+                    if action == FLAG:
+                        sequential.toggle_flag(x, y)
+                    elif action == CHORD or (cell.is_revealed and not cell.is_mine and cell.adjacent_mines > 0):
+                        sequential.chord(x, y)
+                    else:
+                        sequential.reveal_cell(x, y)
+                    if sequential.is_game_over() or sequential.is_win():
+                        expected.append(self.snapshot(sequential))
+                        sequential.new_game()
+                expected.append(self.snapshot(sequential))
+
+            random.seed(seed)
+            batched = MinesweeperGame(10, 10, 8)
+            queue = ActionQueue(batched)
+            states = []
+            for batch in batches:
+                for action in batch:
+                    queue.enqueue(*action)
+                while True:
+                    queue.apply_pending()
+                    if batched.is_game_over() or batched.is_win():
+                        states.append(self.snapshot(batched))
+                        batched.new_game()
+                    if not len(queue):
+                        break
+                states.append(self.snapshot(batched))
+
+            self.assertEqual(states, expected, f"seed {seed}")
+
+    def snapshot(self, game):
+        """Return the parts of the game state a batch must reproduce."""
+        visible = game.get_board_state()
+        # The state code array must track every change made by the batch
+        self.assertEqual(game.get_board_codes().tolist(), [[STATE_CODES[cell] for cell in row] for row in visible])
+        return visible, game.is_game_over(), game.is_win(), game.flags_used
+
+    def test_actions_after_game_end_stay_queued(self):
+        """Test that actions after the one that ends the game are kept for the next game."""
+        self.game.reveal_cell(5, 5)
+        x, y = next((x, y) for y in range(10) for x in range(10) if self.game.board.grid[y][x].is_mine)
+        self.queue.enqueue(REVEAL, x, y)
+        self.queue.enqueue(FLAG, 0, 0)
+        self.queue.enqueue(REVEAL, 1, 1)
+        self.queue.apply_pending()
+
+        self.assertTrue(self.game.is_game_over())
+        self.assertEqual(self.queue.pending, [(FLAG, 0, 0), (REVEAL, 1, 1)])
+        self.assertEqual(self.queue.applied, 1)
+
+    def test_measure_actions_per_second(self):
+        """Test that the throughput measurement runs and reports a rate."""
+        rate = measure_actions_per_second(self.game, synthetic_actions(10, 10, 500, seed=0))
+        self.assertGreater(rate, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from board import Board
+from cell import STATE_CODES
 
 class TestBoard(unittest.TestCase):
     def test_board_initialization(self):
@@ -63,6 +64,30 @@ class TestBoard(unittest.TestCase):
         # Can't flag revealed cells
         board.grid[0][0].is_revealed = True
         self.assertFalse(board.toggle_flag(0, 0))
+    
+    def test_state_codes(self):
+        """Test that state codes match the visible board."""
+        board = Board(10, 10, 15)
+        board.reveal_cell(5, 5)
+        board.toggle_flag(0, 0)
+        
+        self.assert_codes_match(board)
+        
+        # Codes stay in step through unflagging and revealing the mines
+        board.toggle_flag(0, 0)
+        board.reveal_mines()
+        self.assert_codes_match(board)
+    
+    def assert_codes_match(self, board):
+        """Check that the board's state codes match its visible board."""
+        codes = board.get_state_codes()
+        self.assertEqual(codes.shape, (board.height, board.width))
+        self.assertEqual(codes.dtype.name, "uint8")
+        
+        visible = board.get_visible_board()
+        for y in range(board.height):
+            for x in range(board.width):
+                self.assertEqual(codes[y][x], STATE_CODES[visible[y][x]])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pygame.surfarray
+from cell import MINE_CODE
+from game import MinesweeperGame
+from ui.renderer import GameRenderer
+from ui.atlas_renderer import AtlasRenderer
+
+class TestAtlasRenderer(unittest.TestCase):
+    def setUp(self):
+        self.game = MinesweeperGame(12, 9, 20)
+        self.game.reveal_cell(6, 4)
+        self.game.toggle_flag(0, 0)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def board_pixels(self, renderer):
+        """Copy the board area of the renderer's screen."""
+        board_area = pygame.Rect(0, renderer.stats_height, renderer.screen_width, renderer.height * renderer.cell_size)
+        return pygame.surfarray.array3d(renderer.screen.subsurface(board_area))
+
+    def test_matches_classic_renderer(self):
+        """Test that the atlas renderer draws the same pixels as the classic one."""
+        classic = GameRenderer(12, 9, 30)
+        classic.draw_board(self.game.get_board_state())
+        expected = self.board_pixels(classic)
+
+        atlas = AtlasRenderer(12, 9, 30)
+        atlas.draw_board(self.game.get_board_codes())
+        self.assertTrue((self.board_pixels(atlas) == expected).all())
+
+    def test_matches_classic_renderer_after_loss(self):
+        """Test that mine tiles and the game over overlay match the classic renderer."""
+        x, y = next((x, y) for x, y in self.game.board.mine_positions if (x, y) != (0, 0))
+        self.game.reveal_cell(x, y)
+        self.game.reveal_mines()
+        self.assertTrue(self.game.is_game_over())
+        self.assertIn(MINE_CODE, self.game.get_board_codes())
+
+        classic = GameRenderer(12, 9, 30)
+        classic.draw_board(self.game.get_board_state(), game_over=True)
+        expected = self.board_pixels(classic)
+
+        atlas = AtlasRenderer(12, 9, 30)
+        atlas.draw_board(self.game.get_board_codes(), game_over=True)
+        self.assertTrue((self.board_pixels(atlas) == expected).all())
+
+    def test_partial_update_matches_full_redraw(self):
+        """Test that redrawing only changed cells gives the same result as a full compose."""
+        atlas = AtlasRenderer(12, 9, 30)
+        atlas.draw_board(self.game.get_board_codes())
+
+        self.game.toggle_flag(0, 0)
+        self.game.toggle_flag(11, 8)
+        atlas.draw_board(self.game.get_board_codes())
+        partial = self.board_pixels(atlas)
+
+        atlas.last_codes = None
+        atlas.draw_board(self.game.get_board_codes())
+        self.assertTrue((self.board_pixels(atlas) == partial).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# ui/atlas_renderer.py
+import numpy as np
+import pygame
+import pygame.surfarray
+from cell import STATE_CODES
+from ui.renderer import GameRenderer
+
+class AtlasRenderer(GameRenderer):
+    """
+    Renderer that draws the board from a uint8 state code array.
+    Every cell state is drawn once into a tile atlas; the board surface is then
+    composed with a single numpy gather and surfarray blit, or with one
+    Surface.blits call when only a few cells changed since the last frame.
+    A full redraw costs time per pixel, so 500x500 boards fit in a 30 fps frame
+    with 2px cells; run this module to time it.
+    """
+    # draw_board takes the uint8 array from get_state_codes
+    uses_state_codes = True
+
+    # Above this many changed cells a full numpy compose beats blitting tiles
+    MAX_PARTIAL_CELLS = 256
+
+    def __init__(self, width, height, cell_size=30, stats_height=40):
+        super().__init__(width, height, cell_size, stats_height)
+        self.board_surface = pygame.Surface((width * cell_size, height * cell_size)).convert(self.screen)
+        self.last_codes = None
+        self.build_atlas()
+
+    def build_atlas(self):
+        """Draw each cell state once into a row of tiles, indexed by state code."""
+        num_tiles = max(STATE_CODES.values()) + 1
+        self.atlas = pygame.Surface((num_tiles * self.cell_size, self.cell_size)).convert(self.screen)
+        self.atlas.fill((255, 255, 255))
+
+        for state, code in STATE_CODES.items():
+            rect = pygame.Rect(code * self.cell_size, 0, self.cell_size, self.cell_size)
+            self.draw_cell(self.atlas, rect, state)
+
+        # Source rect of every tile, for Surface.blits
+        self.tile_rects = [
+            pygame.Rect(code * self.cell_size, 0, self.cell_size, self.cell_size)
+            for code in range(num_tiles)
+        ]
+
+        # Pixels of every tile as (code, x, y), for vectorized composition
+        pixels = pygame.surfarray.array2d(self.atlas)
+        self.tile_pixels = np.ascontiguousarray(
+            pixels.reshape(num_tiles, self.cell_size, self.cell_size)
+        )
+
+    def compose_board(self, codes):
+        """Redraw the whole board surface from a (height, width) code array."""
+        # tiles[x, y, px, py] -> pixels[x * cell_size + px, y * cell_size + py]
+        tiles = self.tile_pixels[codes.T]
+        pixels = tiles.transpose(0, 2, 1, 3).reshape(
+            self.width * self.cell_size, self.height * self.cell_size
+        )
+        pygame.surfarray.blit_array(self.board_surface, pixels)
+
+    def update_board(self, codes, changed):
+        """Blit only the changed cells onto the board surface."""
+        self.board_surface.blits(
+            [
+                (
+                    self.atlas,
+                    (x * self.cell_size, y * self.cell_size),
+                    self.tile_rects[codes[y, x]]
+                )
+                for y, x in changed
+            ],
+            doreturn=False
+        )
+
+    def draw_board(self, board_state, game_over=False, win=False):
+        """Draw the board from a uint8 state code array."""
+        codes = np.asarray(board_state, dtype=np.uint8)
+
+        if self.last_codes is None or self.last_codes.shape != codes.shape:
+            self.compose_board(codes)
+        else:
+            changed = np.argwhere(codes != self.last_codes)
+            if len(changed) > self.MAX_PARTIAL_CELLS:
+                self.compose_board(codes)
+            elif len(changed):
+                self.update_board(codes, changed)
+        self.last_codes = codes.copy()
+
+        self.screen.blit(self.board_surface, (0, self.stats_height))
+        self.draw_overlay(game_over, win)
+
+if __name__ == "__main__":
+    import time
+    from game import MinesweeperGame
+
+    # Time full-board redraws at 500x500 with 2px cells (a 1000x1000 board area)
+    game = MinesweeperGame(500, 500, 40000)
+    game.reveal_cell(250, 250)
+    renderer = AtlasRenderer(500, 500, cell_size=2)
+
+    runs = 20
+    start = time.perf_counter()
+    for _ in range(runs):
+        renderer.last_codes = None
+        renderer.draw_board(game.get_board_codes())
+    elapsed = (time.perf_counter() - start) / runs
+    renderer.cleanup()
+    print(f"full redraw: {elapsed * 1000:.1f} ms")
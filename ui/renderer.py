@@ -9,6 +9,9 @@ class GameRenderer:
     CELL_COLOR = (200, 200, 200)
     REVEALED_COLOR = (180, 180, 180)
     
+    # draw_board takes the string board from get_visible_board
+    uses_state_codes = False
+    
     def __init__(self, width, height, cell_size=30, stats_height=40):
         self.width = width
         self.height = height
@@ -64,63 +67,69 @@ class GameRenderer:
         
         for y in range(self.height):
             for x in range(self.width):
-                cell = board_state[y][x]
                 rect = pygame.Rect(
                     x * self.cell_size, 
                     y * self.cell_size + self.stats_height,  # Offset for stats bar
                     self.cell_size, 
                     self.cell_size
                 )
+                self.draw_cell(self.screen, rect, board_state[y][x])
+        
+        self.draw_overlay(game_over, win)
+    
+    def draw_cell(self, surface, rect, cell):
+        """Draw a single cell in the given rect of the surface."""
+        # Draw cell background
+        if cell == "■":  # Unrevealed
+            pygame.draw.rect(surface, self.CELL_COLOR, rect)
+        elif cell == "F":  # Flagged
+            pygame.draw.rect(surface, self.CELL_COLOR, rect)
+            
+            # Draw flag image if available, otherwise use fallback
+            if self.flag_img:
+                img_rect = self.flag_img.get_rect(center=rect.center)
+                surface.blit(self.flag_img, img_rect)
+            else:
+                # Fallback to colored rectangle
+                flag_rect = pygame.Rect(
+                    rect.x + self.cell_size // 4,
+                    rect.y + self.cell_size // 4,
+                    self.cell_size // 2,
+                    self.cell_size // 2
+                )
+                pygame.draw.rect(surface, (255, 165, 0), flag_rect)
                 
-                # Draw cell background
-                if cell == "■":  # Unrevealed
-                    pygame.draw.rect(self.screen, self.CELL_COLOR, rect)
-                elif cell == "F":  # Flagged
-                    pygame.draw.rect(self.screen, self.CELL_COLOR, rect)
-                    
-                    # Draw flag image if available, otherwise use fallback
-                    if self.flag_img:
-                        img_rect = self.flag_img.get_rect(center=rect.center)
-                        self.screen.blit(self.flag_img, img_rect)
-                    else:
-                        # Fallback to colored rectangle
-                        flag_rect = pygame.Rect(
-                            x * self.cell_size + self.cell_size // 4,
-                            y * self.cell_size + self.stats_height + self.cell_size // 4,
-                            self.cell_size // 2,
-                            self.cell_size // 2
-                        )
-                        pygame.draw.rect(self.screen, (255, 165, 0), flag_rect)
-                        
-                elif cell == "X":  # Mine
-                    pygame.draw.rect(self.screen, self.REVEALED_COLOR, rect)
-                    
-                    # Draw bomb image if available, otherwise use fallback
-                    if self.bomb_img:
-                        img_rect = self.bomb_img.get_rect(center=rect.center)
-                        self.screen.blit(self.bomb_img, img_rect)
-                    else:
-                        # Fallback to colored circle
-                        center_x = x * self.cell_size + self.cell_size // 2
-                        center_y = y * self.cell_size + self.stats_height + self.cell_size // 2
-                        radius = self.cell_size // 3
-                        pygame.draw.circle(self.screen, (255, 0, 0), (center_x, center_y), radius)
-                        
-                else:  # Revealed with number or empty
-                    pygame.draw.rect(self.screen, self.REVEALED_COLOR, rect)
-                    if cell != " ":  # Has adjacent mines
-                        num = int(cell)
-                        text_color = self.get_number_color(num)
-                        text = self.font.render(cell, True, text_color)
-                        text_rect = text.get_rect(center=(
-                            x * self.cell_size + self.cell_size // 2,
-                            y * self.cell_size + self.stats_height + self.cell_size // 2
-                        ))
-                        self.screen.blit(text, text_rect)
+        elif cell == "X":  # Mine
+            pygame.draw.rect(surface, self.REVEALED_COLOR, rect)
+            
+            # Draw bomb image if available, otherwise use fallback
+            if self.bomb_img:
+                img_rect = self.bomb_img.get_rect(center=rect.center)
+                surface.blit(self.bomb_img, img_rect)
+            else:
+                # Fallback to colored circle
+                center_x = rect.x + self.cell_size // 2
+                center_y = rect.y + self.cell_size // 2
+                radius = self.cell_size // 3
+                pygame.draw.circle(surface, (255, 0, 0), (center_x, center_y), radius)
                 
-                # Draw cell border
-                pygame.draw.rect(self.screen, self.GRID_COLOR, rect, 1)
+        else:  # Revealed with number or empty
+            pygame.draw.rect(surface, self.REVEALED_COLOR, rect)
+            if cell != " ":  # Has adjacent mines
+                num = int(cell)
+                text_color = self.get_number_color(num)
+                text = self.font.render(cell, True, text_color)
+                text_rect = text.get_rect(center=(
+                    rect.x + self.cell_size // 2,
+                    rect.y + self.cell_size // 2
+                ))
+                surface.blit(text, text_rect)
         
+        # Draw cell border
+        pygame.draw.rect(surface, self.GRID_COLOR, rect, 1)
+    
+    def draw_overlay(self, game_over=False, win=False):
+        """Draw the game over or win message over the board."""
         # Draw game over or win message
         if game_over or win:
             overlay = pygame.Surface((self.screen_width, self.height * self.cell_size), pygame.SRCALPHA)